@@ -5,13 +5,20 @@ Helper script to manually create/update the league data JSON file.
 Use this if the automated scraper fails due to 403 errors or other issues.
 """
 
-import json
+import re
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 DATA_DIR = Path(__file__).parent.parent / "data"
 DATA_FILE = DATA_DIR / "results.json"
 
+# "Home Team vs Away Team, 3-1" (also accepts " v " and an en dash in the score)
+_FIXTURE_RE = re.compile(
+    r"^(?P<home>.+?)\s+vs?\s+(?P<away>.+?)\s*,\s*(?P<home_score>\d+)\s*[-–]\s*(?P<away_score>\d+)\s*$"
+)
+
 
 def create_manual_data():
     """Interactive script to create league data manually."""
@@ -61,35 +68,22 @@ def create_manual_data():
                 break
             
             # Parse fixture
-            try:
-                if " vs " in fixture_input or " v " in fixture_input:
-                    separator = " vs " if " vs " in fixture_input else " v "
-                    parts = fixture_input.split(separator)
-                    if len(parts) == 2:
-                        home_part = parts[0].strip()
-                        away_part = parts[1].strip()
-                        
-                        # Extract scores
-                        if "," in away_part:
-                            away_team, scores = away_part.rsplit(",", 1)
-                            scores = scores.strip()
-                            if "-" in scores:
-                                home_score, away_score = map(int, scores.split("-"))
-                                home_team = home_part.strip()
-                                away_team = away_team.strip()
-                                
-                                fixtures.append({
-                                    "home": home_team,
-                                    "away": away_team,
-                                    "home_score": home_score,
-                                    "away_score": away_score
-                                })
-                                print(f"  ✓ Added: {home_team} {home_score}-{away_score} {away_team}")
-                                continue
-                
+            match = _FIXTURE_RE.match(fixture_input)
+            if not match:
                 print("  ⚠️  Could not parse. Try: 'Team A vs Team B, 3-1'")
-            except Exception as e:
-                print(f"  ⚠️  Error: {e}")
+                continue
+            
+            home_team = match.group("home")
+            away_team = match.group("away")
+            home_score = int(match.group("home_score"))
+            away_score = int(match.group("away_score"))
+            fixtures.append({
+                "home": home_team,
+                "away": away_team,
+                "home_score": home_score,
+                "away_score": away_score
+            })
+            print(f"  ✓ Added: {home_team} {home_score}-{away_score} {away_team}")
         
         if fixtures:
             gameweeks.append({
@@ -112,8 +106,7 @@ def create_manual_data():
     
     # Save
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    DATA_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     
     print("\n" + "=" * 60)
     print(f"✓ Data saved to {DATA_FILE}")
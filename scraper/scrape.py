@@ -9,61 +9,248 @@ This script fetches league data from playfootball.net and extracts:
 Outputs structured JSON to data/results.json
 """
 
-import json
+import argparse
+import hashlib
+import io
 import re
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
+import ahocorasick
+import orjson
 import requests
-from bs4 import BeautifulSoup
 import urllib3
+from lxml import etree
+from requests.adapters import HTTPAdapter
 
 
 LEAGUE_URL = "https://www.playfootball.net/venues/islington-market-road/players-lounge/3359/15144/186"
 DATA_DIR = Path(__file__).parent.parent / "data"
 DATA_FILE = DATA_DIR / "results.json"
+CACHE_DIR = DATA_DIR / ".cache"
+# Age limit used when the disk cache is enabled for development (--cache);
+# normal runs always refetch
+CACHE_MAX_AGE_SECONDS = 2 * 60 * 60
 
+# More realistic browser headers to avoid bot detection
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0"
+}
 
-def fetch_page(url: str) -> BeautifulSoup:
+# Disable SSL verification warnings (for local development)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+def _create_session() -> requests.Session:
+    """Build the shared HTTP session with browser headers and pooled connections."""
+    session = requests.Session()
+    session.headers.update(REQUEST_HEADERS)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One session per process keeps cookies and reuses TCP/TLS connections across
+# requests (including the 403 retry below) instead of reconnecting every time
+_SESSION = _create_session()
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains ``name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Regex patterns are compiled once at import time rather than on every call
+_SCORE_RE = re.compile(r"(\d+)\s*[-–]\s*(\d+)")
+_SECTION_CLASS_RE = re.compile(r"gameweek|round|week|fixture", re.I)
+_MATCH_CLASS_RE = re.compile(r"match|fixture", re.I)
+_TABLE_CLASS_RE = re.compile(r"fixture|match|result", re.I)
+
+# Elements discarded as soon as the streaming parser finishes them; extraction
+# never reads their contents (scripts, styling, site chrome, embeds and head
+# metadata), so they are never kept in the tree
+_PRUNED_TAGS = (
+    "script", "style", "noscript", "nav", "footer", "svg", "iframe", "link", "meta",
+)
+
+# XPath expressions are compiled once at import time and reused for every call
+_TEXT = etree.XPath("string()", smart_strings=False)
+_TEAM_XPATHS = [
+    etree.XPath(f"//table[{_has_class('league-table')}]//tr/td[1]"),
+    etree.XPath(f"//table//tr//td[{_has_class('team-name')}]"),
+    etree.XPath(f"//*[{_has_class('team-name')}]"),
+    etree.XPath(f"//table[{_has_class('standings')}]//tr/td[2]"),  # Usually team name is 2nd column
+]
+_ALL_TABLES = etree.XPath("//table")
+_ROWS = etree.XPath(".//tr")
+_CLASSED_ROWS = etree.XPath(".//tr[@class] | .//div[@class]")
+_CELLS = etree.XPath(".//td | .//th")
+_SECOND_CELL = etree.XPath("(.//td | .//th)[2]")
+_TABLE_ROWS = etree.XPath("//table//tr")
+
+
+def _drop_element(elem: etree._Element) -> None:
+    """Remove an element from the tree, keeping the text that follows it."""
+    parent = elem.getparent()
+    if parent is None:
+        return
+    
+    if elem.tail:
+        previous = elem.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + elem.tail
+        else:
+            parent.text = (parent.text or "") + elem.tail
+    parent.remove(elem)
+
+
+def parse_html(content, encoding: Optional[str] = None) -> etree._Element:
+    """
+    Stream-parse an HTML document into an lxml tree.
+    
+    Scripts, styles, navigation, footers and embeds are removed as soon as
+    they are parsed, and comments and processing instructions are never built,
+    so peak memory is bounded by the content extraction actually uses.
+    
+    Args:
+        content: Raw HTML as bytes or str
+        encoding: Known encoding of byte content; if omitted, libxml2 uses the
+            document's own charset declaration
+        
+    Returns:
+        Root element of the parsed HTML (an empty <html> element if the
+        document has no content)
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+        encoding = "utf-8"
+    
+    # libxml2 rejects an empty document outright, and yields no root for one
+    # holding only whitespace or comments; both simply have nothing to extract
+    if not content.strip():
+        return etree.Element("html")
+    
+    try:
+        root = _stream_parse(content, encoding)
+    except LookupError:
+        # libxml2 does not know every name Python does (e.g. "latin_1",
+        # "utf-8-sig"); fall back to the document's own declaration
+        root = _stream_parse(content, None)
+    
+    if root is None:
+        return etree.Element("html")
+    return root
+
+
+def _stream_parse(content: bytes, encoding: Optional[str]) -> Optional[etree._Element]:
+    """Run the pruning iterparse over content and return its root, if any."""
+    events = etree.iterparse(
+        io.BytesIO(content),
+        events=("end",),
+        tag=_PRUNED_TAGS,
+        html=True,
+        remove_comments=True,
+        remove_pis=True,
+        encoding=encoding,
+    )
+    for _, elem in events:
+        _drop_element(elem)
+    
+    return events.root
+
+
+def _declared_encoding(response: requests.Response) -> Optional[str]:
+    """Return the charset from the Content-Type header, if one is declared."""
+    # requests falls back to ISO-8859-1 for text/* without a charset, which
+    # would override a <meta charset> in the page, so only trust explicit ones
+    if "charset=" not in response.headers.get("Content-Type", "").lower():
+        return None
+    return response.encoding
+
+
+def _cache_path(url: str, source: str) -> Path:
+    """Return the on-disk cache file for a URL fetched by the given source."""
+    return CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.{source}.html"
+
+
+def read_cached_page(
+    url: str, max_age_seconds: int, source: str = "http"
+) -> Optional[Tuple[bytes, Optional[str]]]:
+    """
+    Read a previously fetched page from the disk cache.
+    
+    Args:
+        url: URL the page was fetched from
+        max_age_seconds: Maximum age of a usable cache entry (0 disables the cache)
+        source: How the page was fetched ("http" or "rendered"); each source
+            has its own cache entry
+        
+    Returns:
+        Tuple of raw page content and its known encoding (or None if the
+        document's own declaration should be used), or None if there is no
+        fresh cache entry
+    """
+    if max_age_seconds <= 0:
+        return None
+    
+    path = _cache_path(url, source)
+    try:
+        if path.stat().st_mtime < time.time() - max_age_seconds:
+            return None
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    
+    # The first line holds the encoding recorded by write_cached_page
+    encoding, _, content = data.partition(b"\n")
+    return content, encoding.decode("ascii") or None
+
+
+def write_cached_page(
+    url: str, content: bytes, encoding: Optional[str] = None, source: str = "http"
+) -> None:
+    """Store fetched page content, and its encoding if known, in the disk cache."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    header = (encoding or "").encode("ascii") + b"\n"
+    _cache_path(url, source).write_bytes(header + content)
+
+
+def fetch_page(url: str, max_age_seconds: int = 0) -> etree._Element:
     """
     Fetch and parse the league page HTML.
     
     Args:
         url: The playfootball.net league URL
+        max_age_seconds: Reuse a cached copy of the page younger than this (0 disables the cache)
         
     Returns:
-        BeautifulSoup object of the parsed HTML
+        Root element of the parsed HTML
         
     Raises:
         requests.RequestException: If the request fails
     """
-    # More realistic browser headers to avoid bot detection
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-        "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8",
-        "Accept-Encoding": "gzip, deflate, br",
-        "DNT": "1",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Sec-Fetch-User": "?1",
-        "Cache-Control": "max-age=0"
-    }
-    
-    # Use a session to maintain cookies
-    session = requests.Session()
-    session.headers.update(headers)
-    
-    # Disable SSL verification warnings (for local development)
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    cached = read_cached_page(url, max_age_seconds)
+    if cached is not None:
+        print("Using cached page")
+        content, encoding = cached
+        return parse_html(content, encoding)
     
     try:
-        response = session.get(url, timeout=30, verify=False, allow_redirects=True)
+        response = _SESSION.get(url, timeout=30, verify=False, allow_redirects=True)
         response.raise_for_status()
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 403:
@@ -75,85 +262,132 @@ def fetch_page(url: str) -> BeautifulSoup:
             print("\n   Trying with additional headers...")
             
             # Try with referer
-            headers["Referer"] = "https://www.playfootball.net/"
-            session.headers.update(headers)
-            response = session.get(url, timeout=30, verify=False, allow_redirects=True)
+            response = _SESSION.get(
+                url,
+                headers={"Referer": "https://www.playfootball.net/"},
+                timeout=30,
+                verify=False,
+                allow_redirects=True,
+            )
             response.raise_for_status()
         else:
             raise
     
-    return BeautifulSoup(response.content, "lxml")
+    encoding = _declared_encoding(response)
+    if max_age_seconds > 0:
+        write_cached_page(url, response.content, encoding)
+    
+    return parse_html(response.content, encoding)
+
+
+def build_team_finder(teams: List[str]) -> ahocorasick.Automaton:
+    """
+    Build an Aho-Corasick automaton that locates every team name in one pass.
+    
+    Args:
+        teams: List of team names
+        
+    Returns:
+        Automaton mapping each team name to itself
+    """
+    finder = ahocorasick.Automaton()
+    for team in teams:
+        finder.add_word(team, team)
+    finder.make_automaton()
+    return finder
+
+
+def find_teams(finder: ahocorasick.Automaton, text: str) -> List[Tuple[int, str]]:
+    """
+    Locate the first occurrence of each team name in a piece of text.
+    
+    Args:
+        finder: Automaton built by build_team_finder
+        text: Text to scan
+        
+    Returns:
+        List of (position, team) tuples ordered by position
+    """
+    # An automaton built from no teams cannot be searched
+    if finder.kind != ahocorasick.AHOCORASICK:
+        return []
+    
+    first_seen = {}
+    for end, team in finder.iter(text):
+        if team not in first_seen:
+            first_seen[team] = end - len(team) + 1
+    
+    return sorted((pos, team) for team, pos in first_seen.items())
 
 
-def extract_teams(soup: BeautifulSoup) -> List[str]:
+def extract_teams(root: etree._Element) -> List[str]:
     """
     Extract team names from the league table.
     
     Args:
-        soup: Parsed HTML soup
+        root: Root element of the parsed HTML
         
     Returns:
         List of team names (sorted alphabetically for consistency)
     """
-    teams = []
+    teams: Set[str] = set()
     
     # Try multiple selectors - will need to inspect actual page structure
     # Common patterns: table rows, divs with team names, etc.
-    selectors = [
-        "table.league-table tr td:first-child",
-        "table tr td.team-name",
-        ".team-name",
-        "table.standings tr td:nth-of-type(2)",  # Usually team name is 2nd column
-    ]
-    
-    for selector in selectors:
-        elements = soup.select(selector)
-        if elements:
-            for elem in elements:
-                team_name = elem.get_text(strip=True)
-                if team_name and team_name not in teams and len(team_name) > 1:
-                    teams.append(team_name)
-            if teams:
-                break
+    # The first selector that yields any team wins, so later ones never run
+    for team_xpath in _TEAM_XPATHS:
+        for elem in team_xpath(root):
+            team_name = _TEXT(elem).strip()
+            if team_name and len(team_name) > 1:
+                teams.add(team_name)
+        if teams:
+            return sorted(teams)
     
     # Fallback: look for any table rows that might contain team names
-    if not teams:
-        tables = soup.find_all("table")
-        for table in tables:
-            rows = table.find_all("tr")[1:]  # Skip header
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                if len(cells) >= 2:
-                    potential_team = cells[1].get_text(strip=True)
-                    if potential_team and len(potential_team) > 1:
-                        if potential_team not in teams:
-                            teams.append(potential_team)
-    
-    return sorted(list(set(teams))) if teams else []
-
-
-def extract_fixtures(soup: BeautifulSoup, teams: List[str]) -> List[Dict]:
+    for table in _ALL_TABLES(root):
+        for row in _ROWS(table)[1:]:  # Skip header
+            second_cell = _SECOND_CELL(row)
+            if second_cell:
+                potential_team = _TEXT(second_cell[0]).strip()
+                if potential_team and len(potential_team) > 1:
+                    teams.add(potential_team)
+    
+    return sorted(teams)
+
+
+def extract_fixtures(root: etree._Element, teams: List[str]) -> List[Dict]:
     """
     Extract match fixtures organized by gameweek.
     
     Args:
-        soup: Parsed HTML soup
+        root: Root element of the parsed HTML
         teams: List of team names (for validation)
         
     Returns:
         List of gameweek dictionaries, each containing fixtures
     """
     gameweeks = []
+    team_finder = build_team_finder(teams)
     
     # Try to find fixtures organized by gameweek/round
     # Common patterns: sections per gameweek, tables per round, etc.
+    # Classify candidate containers for both element patterns in a single walk
+    gameweek_sections = []
+    match_tables = []
+    for elem in root.iter("section", "div", "table"):
+        css_class = elem.get("class")
+        if not css_class:
+            continue
+        if elem.tag == "table":
+            if _TABLE_CLASS_RE.search(css_class):
+                match_tables.append(elem)
+        elif _SECTION_CLASS_RE.search(css_class):
+            gameweek_sections.append(elem)
     
     # Pattern 1: Look for sections/divs with gameweek indicators
-    gameweek_sections = soup.find_all(["section", "div"], class_=re.compile(r"gameweek|round|week|fixture", re.I))
-    
     if gameweek_sections:
         for idx, section in enumerate(gameweek_sections, 1):
-            fixtures = extract_fixtures_from_section(section, teams)
+            fixtures = extract_fixtures_from_section(section, team_finder)
             if fixtures:
                 gameweeks.append({
                     "week": idx,
@@ -163,12 +397,10 @@ def extract_fixtures(soup: BeautifulSoup, teams: List[str]) -> List[Dict]:
     
     # Pattern 2: Look for tables with match results
     if not gameweeks:
-        match_tables = soup.find_all("table", class_=re.compile(r"fixture|match|result", re.I))
-        
         if match_tables:
             # Group by table (assuming each table is a gameweek)
             for idx, table in enumerate(match_tables, 1):
-                fixtures = extract_fixtures_from_table(table, teams)
+                fixtures = extract_fixtures_from_table(table, team_finder)
                 if fixtures:
                     gameweeks.append({
                         "week": idx,
@@ -178,29 +410,20 @@ def extract_fixtures(soup: BeautifulSoup, teams: List[str]) -> List[Dict]:
     
     # Pattern 3: Look for any table rows that look like match results
     if not gameweeks:
-        all_tables = soup.find_all("table")
-        current_week = None
         week_fixtures = []
-        
-        for table in all_tables:
-            rows = table.find_all("tr")
-            for row in rows:
-                # Check if row contains match data (has scores, team names)
-                cells = [cell.get_text(strip=True) for cell in row.find_all(["td", "th"])]
-                
-                # Look for score pattern (e.g., "3-1", "2 - 2")
-                score_match = None
-                for cell in cells:
-                    score_match = re.search(r"(\d+)\s*[-–]\s*(\d+)", cell)
-                    if score_match:
-                        break
-                
-                if score_match:
-                    fixture = parse_fixture_row(row, teams, score_match)
-                    if fixture:
-                        if not current_week:
-                            current_week = 1
-                        week_fixtures.append(fixture)
+        for row in _TABLE_ROWS(root):
+            # Most rows have no score, so test the row's flat text first and
+            # only split it into cells when a score is present
+            if not _SCORE_RE.search(_TEXT(row)):
+                continue
+            
+            # Cell texts are joined with spaces so numbers in adjacent cells stay apart
+            text = " ".join(_TEXT(cell).strip() for cell in _CELLS(row))
+            score_match = _SCORE_RE.search(text)
+            if score_match:
+                fixture = parse_fixture_row(text, team_finder, score_match)
+                if fixture:
+                    week_fixtures.append(fixture)
         
         if week_fixtures:
             # For now, group all into one gameweek - will refine based on actual structure
@@ -213,55 +436,55 @@ def extract_fixtures(soup: BeautifulSoup, teams: List[str]) -> List[Dict]:
     return gameweeks
 
 
-def extract_fixtures_from_section(section, teams: List[str]) -> List[Dict]:
+def extract_fixtures_from_section(section, team_finder: ahocorasick.Automaton) -> List[Dict]:
     """Extract fixtures from a section element."""
     fixtures = []
-    rows = section.find_all(["tr", "div"], class_=re.compile(r"match|fixture", re.I))
+    rows = [
+        row for row in _CLASSED_ROWS(section)
+        if _MATCH_CLASS_RE.search(row.get("class"))
+    ]
     
     for row in rows:
-        text = row.get_text()
-        score_match = re.search(r"(\d+)\s*[-–]\s*(\d+)", text)
+        text = _TEXT(row)
+        score_match = _SCORE_RE.search(text)
         if score_match:
-            fixture = parse_fixture_row(row, teams, score_match)
+            fixture = parse_fixture_row(text, team_finder, score_match)
             if fixture:
                 fixtures.append(fixture)
     
     return fixtures
 
 
-def extract_fixtures_from_table(table, teams: List[str]) -> List[Dict]:
+def extract_fixtures_from_table(table, team_finder: ahocorasick.Automaton) -> List[Dict]:
     """Extract fixtures from a table element."""
     fixtures = []
-    rows = table.find_all("tr")[1:]  # Skip header
+    rows = _ROWS(table)[1:]  # Skip header
     
     for row in rows:
-        cells = [cell.get_text(strip=True) for cell in row.find_all(["td", "th"])]
+        cells = [_TEXT(cell).strip() for cell in _CELLS(row)]
         text = " ".join(cells)
-        score_match = re.search(r"(\d+)\s*[-–]\s*(\d+)", text)
+        score_match = _SCORE_RE.search(text)
         
         if score_match:
-            fixture = parse_fixture_row(row, teams, score_match)
+            fixture = parse_fixture_row(text, team_finder, score_match)
             if fixture:
                 fixtures.append(fixture)
     
     return fixtures
 
 
-def parse_fixture_row(row, teams: List[str], score_match: re.Match) -> Optional[Dict]:
+def parse_fixture_row(text: str, team_finder: ahocorasick.Automaton, score_match: re.Match) -> Optional[Dict]:
     """
-    Parse a table row or element to extract fixture data.
+    Parse the text of a table row or element to extract fixture data.
     
     Args:
-        row: BeautifulSoup element containing match data
-        teams: List of valid team names
-        score_match: Regex match object for the score
+        text: Text of the row, already serialized by the caller
+        team_finder: Automaton of valid team names (see build_team_finder)
+        score_match: Regex match object for the score, searched over ``text``
         
     Returns:
         Dictionary with home, away, home_score, away_score, or None if invalid
     """
-    text = row.get_text()
-    cells = [cell.get_text(strip=True) for cell in row.find_all(["td", "th", "span", "div"])]
-    
     home_score = int(score_match.group(1))
     away_score = int(score_match.group(2))
     
@@ -270,28 +493,20 @@ def parse_fixture_row(row, teams: List[str], score_match: re.Match) -> Optional[
     away_team = None
     
     # Look for team names before and after the score
-    for team in teams:
-        # Check if team name appears in the text
-        if team in text:
-            # Try to determine if it's home or away based on position relative to score
-            score_pos = text.find(score_match.group(0))
-            team_pos = text.find(team)
-            
-            if team_pos < score_pos:
-                if not home_team:
-                    home_team = team
-            else:
-                if not away_team:
-                    away_team = team
+    found_teams = find_teams(team_finder, text)
+    if found_teams:
+        # Determine home or away based on position relative to score
+        score_pos = score_match.start()
+        home_team = next((team for pos, team in found_teams if pos < score_pos), None)
+        away_team = next((team for pos, team in found_teams if pos >= score_pos), None)
     
     # Fallback: use first two teams found in order
     if not home_team or not away_team:
-        found_teams = [team for team in teams if team in text]
         if len(found_teams) >= 2:
-            home_team = found_teams[0]
-            away_team = found_teams[1]
+            home_team = found_teams[0][1]
+            away_team = found_teams[1][1]
         elif len(found_teams) == 1:
-            home_team = found_teams[0]
+            home_team = found_teams[0][1]
             # Try to infer away team from context
             away_team = None
     
@@ -306,12 +521,12 @@ def parse_fixture_row(row, teams: List[str], score_match: re.Match) -> Optional[
     return None
 
 
-def extract_league_info(soup: BeautifulSoup) -> Dict[str, str]:
+def extract_league_info(root: etree._Element) -> Dict[str, str]:
     """
     Extract league metadata (name, venue, etc.).
     
     Args:
-        soup: Parsed HTML soup
+        root: Root element of the parsed HTML
         
     Returns:
         Dictionary with league_name and venue
@@ -322,40 +537,43 @@ def extract_league_info(soup: BeautifulSoup) -> Dict[str, str]:
     }
     
     # Try to extract from page title or headings
-    title = soup.find("title")
-    if title:
-        title_text = title.get_text()
+    title = root.find(".//title")
+    if title is not None:
+        title_text = _TEXT(title)
         if "Players Lounge" in title_text:
             info["league_name"] = "Players Lounge"
     
-    h1 = soup.find("h1")
-    if h1:
-        h1_text = h1.get_text(strip=True)
+    h1 = root.find(".//h1")
+    if h1 is not None:
+        h1_text = _TEXT(h1).strip()
         if h1_text:
             info["league_name"] = h1_text
     
     return info
 
 
-def scrape_league() -> Dict:
+def scrape_league(max_age_seconds: int = 0) -> Dict:
     """
     Main scraping function.
     
+    Args:
+        max_age_seconds: Reuse a cached copy of the page younger than this (0 always refetches)
+        
     Returns:
         Dictionary with league data structure
     """
     print(f"Fetching data from {LEAGUE_URL}...")
-    soup = fetch_page(LEAGUE_URL)
+    root = fetch_page(LEAGUE_URL, max_age_seconds)
     
     print("Extracting league information...")
-    league_info = extract_league_info(soup)
+    league_info = extract_league_info(root)
     
     print("Extracting teams...")
-    teams = extract_teams(soup)
+    teams = extract_teams(root)
     print(f"Found {len(teams)} teams: {', '.join(teams)}")
     
     print("Extracting fixtures...")
-    gameweeks = extract_fixtures(soup, teams)
+    gameweeks = extract_fixtures(root, teams)
     print(f"Found {len(gameweeks)} gameweeks with {sum(len(gw['fixtures']) for gw in gameweeks)} total fixtures")
     
     result = {
@@ -373,16 +591,23 @@ def save_data(data: Dict) -> None:
     """Save scraped data to JSON file."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    DATA_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     
     print(f"Data saved to {DATA_FILE}")
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Scrape league results from playfootball.net")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"reuse a cached copy of the page up to {CACHE_MAX_AGE_SECONDS // 3600}h old (for development)",
+    )
+    args = parser.parse_args()
+    
     try:
-        data = scrape_league()
+        data = scrape_league(CACHE_MAX_AGE_SECONDS if args.cache else 0)
         save_data(data)
         print("Scraping completed successfully!")
     except requests.exceptions.HTTPError as e:
@@ -392,7 +617,7 @@ def main():
             print("="*60)
             print("\nOptions:")
             print("1. Try the Selenium scraper: python scrape_selenium.py")
-            print("   (Requires: pip install selenium)")
+            print("   (Requires: pip install -r requirements.txt selenium)")
             print("2. Manually edit data/results.json with your team data")
             print("3. Check if the page requires login/authentication")
             print("\nThe site may require JavaScript rendering or have anti-bot protection.")
@@ -4,21 +4,26 @@ Alternative scraper using Selenium for JavaScript-rendered pages.
 This version uses Selenium WebDriver to handle sites that require JavaScript
 or have anti-bot protection that blocks simple HTTP requests.
 
-Install: pip install selenium beautifulsoup4
+Install: pip install -r requirements.txt selenium
 Requires: ChromeDriver or geckodriver (Firefox)
 """
 
-import json
+import argparse
+import atexit
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
-from bs4 import BeautifulSoup
+import orjson
+from lxml import etree
+
+from scrape import CACHE_MAX_AGE_SECONDS, parse_html, read_cached_page, write_cached_page
 
 # Try to import selenium, fall back gracefully if not installed
 try:
     from selenium import webdriver
+    from selenium.common.exceptions import TimeoutException
     from selenium.webdriver.chrome.options import Options as ChromeOptions
     from selenium.webdriver.chrome.service import Service as ChromeService
     from selenium.webdriver.common.by import By
@@ -34,20 +39,53 @@ LEAGUE_URL = "https://www.playfootball.net/venues/islington-market-road/players-
 DATA_DIR = Path(__file__).parent.parent / "data"
 DATA_FILE = DATA_DIR / "results.json"
 
+# Subresources Chrome is told not to fetch; only the DOM is needed for scraping
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.webp",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.css",
+    "*googletagmanager*",
+    "*google-analytics*",
+    "*doubleclick*",
+]
+# Restart the browser after this many page loads to keep its memory in check
+DRIVER_MAX_PAGES = 20
+# Elements that hold the league data; the page is ready once one of them exists
+READY_XPATH = "//table | //*[contains(@class, 'fixture') or contains(@class, 'gameweek')]"
 
-def fetch_page_selenium(url: str) -> BeautifulSoup:
-    """
-    Fetch page using Selenium WebDriver (handles JavaScript).
-    
-    Args:
-        url: The playfootball.net league URL
-        
-    Returns:
-        BeautifulSoup object of the parsed HTML
-    """
-    if not SELENIUM_AVAILABLE:
-        raise ImportError("Selenium is not installed. Run: pip install selenium")
-    
+# Score pattern is compiled once at import time rather than on every call
+_SCORE_RE = re.compile(r"(\d+)\s*[-–]\s*(\d+)")
+
+# XPath expressions are compiled once at import time and reused for every call
+_TEXT = etree.XPath("string()", smart_strings=False)
+_TEAM_XPATHS = [
+    etree.XPath("//*[contains(concat(' ', normalize-space(@class), ' '), ' team-name ')]"),
+    etree.XPath("//*[contains(@class, 'team')]"),
+]
+_ALL_TABLES = etree.XPath("//table")
+_ROWS = etree.XPath(".//tr")
+_CELLS = etree.XPath(".//td | .//th")
+
+
+def _is_team_like(text: str) -> bool:
+    """Check whether text looks like a team name (capitalized, reasonable length)."""
+    return (
+        bool(text)
+        and 3 <= len(text) <= 50
+        and text[0].isupper()
+        and not any(char.isdigit() for char in text[:3])
+    )
+
+
+def _create_driver():
+    """Start a headless WebDriver, preferring Chrome and falling back to Firefox."""
     # Set up Chrome options
     chrome_options = ChromeOptions()
     chrome_options.add_argument("--headless")  # Run in background
@@ -57,6 +95,8 @@ def fetch_page_selenium(url: str) -> BeautifulSoup:
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
     chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    # Return from driver.get() at DOMContentLoaded rather than after every subresource
+    chrome_options.page_load_strategy = "eager"
     
     try:
         # Try Chrome first
@@ -67,85 +107,143 @@ def fetch_page_selenium(url: str) -> BeautifulSoup:
             from selenium.webdriver.firefox.options import Options as FirefoxOptions
             firefox_options = FirefoxOptions()
             firefox_options.add_argument("--headless")
+            firefox_options.page_load_strategy = "eager"
             driver = webdriver.Firefox(options=firefox_options)
         except Exception as e:
             raise RuntimeError(f"Could not initialize WebDriver. Error: {e}")
     
+    # Block images, fonts, stylesheets and trackers (Chrome DevTools Protocol only)
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    
+    return driver
+
+
+class _DriverPool:
+    """Lazily started WebDriver shared across fetches and recycled periodically."""
+    
+    _driver = None
+    _pages = 0
+    
+    @classmethod
+    def get(cls):
+        """Return the shared driver, starting or recycling it as needed."""
+        if cls._driver is not None and cls._pages >= DRIVER_MAX_PAGES:
+            cls.close()
+        if cls._driver is None:
+            cls._driver = _create_driver()
+        cls._pages += 1
+        return cls._driver
+    
+    @classmethod
+    def close(cls) -> None:
+        """Quit the shared driver if one is running."""
+        driver, cls._driver, cls._pages = cls._driver, None, 0
+        if driver is not None:
+            driver.quit()
+
+
+atexit.register(_DriverPool.close)
+
+
+def fetch_page_selenium(url: str, max_age_seconds: int = 0) -> etree._Element:
+    """
+    Fetch page using Selenium WebDriver (handles JavaScript).
+    
+    Args:
+        url: The playfootball.net league URL
+        max_age_seconds: Reuse a cached copy of the rendered page younger than this (0 disables the cache)
+        
+    Returns:
+        Root element of the parsed HTML
+    """
+    # Rendered pages are cached separately from plain HTTP fetches, as UTF-8
+    cached = read_cached_page(url, max_age_seconds, source="rendered")
+    if cached is not None:
+        print("Using cached page")
+        content, encoding = cached
+        return parse_html(content, encoding)
+    
+    if not SELENIUM_AVAILABLE:
+        raise ImportError("Selenium is not installed. Run: pip install selenium")
+    
+    driver = _DriverPool.get()
     try:
         print(f"Loading page with Selenium...")
         driver.get(url)
         
-        # Wait for page to load (adjust selector based on actual page)
+        # With the eager strategy scripts may still be rendering, so wait for
+        # the league data itself rather than for the whole page
+        ready = True
         try:
             WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "table"))
+                EC.presence_of_element_located((By.XPATH, READY_XPATH))
             )
-        except:
-            # If no table found, just wait a bit for JS to render
-            import time
-            time.sleep(3)
+        except TimeoutException:
+            ready = False
+            print("⚠️  League data did not appear in time, using the page as rendered")
         
         html = driver.page_source
-        return BeautifulSoup(html, "lxml")
-    finally:
-        driver.quit()
+    except Exception:
+        # The browser may be in a bad state; start a fresh one next time
+        _DriverPool.close()
+        raise
+    
+    # A page that never finished rendering is not worth reusing
+    if ready and max_age_seconds > 0:
+        write_cached_page(url, html.encode("utf-8"), "utf-8", source="rendered")
+    return parse_html(html)
 
 
 # Import the extraction functions from the main scraper
 # For now, we'll duplicate the key functions
-def extract_teams(soup: BeautifulSoup) -> List[str]:
+def extract_teams(root: etree._Element) -> List[str]:
     """Extract team names from the league table."""
-    teams = []
+    teams: Set[str] = set()
+    table_cells: Set[str] = set()
     
     # Look for "Colonel Getafe" or other team names
-    # Try various selectors
-    selectors = [
-        "table tr td",
-        ".team-name",
-        "[class*='team']",
-    ]
-    
-    for selector in selectors:
-        elements = soup.select(selector)
-        for elem in elements:
-            text = elem.get_text(strip=True)
-            # Look for team-like names (capitalized, reasonable length)
-            if text and 3 <= len(text) <= 50 and text[0].isupper():
-                if text not in teams and not any(char.isdigit() for char in text[:3]):
-                    teams.append(text)
-        if teams:
-            break
+    # Walk the tables once: team-like <td> text is the first candidate source,
+    # and every non-header cell is kept for the broader table pass below
+    for table in _ALL_TABLES(root):
+        for row_idx, row in enumerate(_ROWS(table)):
+            for cell in _CELLS(row):
+                text = _TEXT(cell).strip()
+                if cell.tag == "td" and _is_team_like(text):
+                    teams.add(text)
+                if row_idx > 0 and text and 3 <= len(text) <= 50:  # Skip header
+                    table_cells.add(text)
+    
+    # Try other selectors if the tables had nothing team-like
+    if not teams:
+        for team_xpath in _TEAM_XPATHS:
+            for elem in team_xpath(root):
+                text = _TEXT(elem).strip()
+                if _is_team_like(text):
+                    teams.add(text)
+            if teams:
+                break
     
     # Also search for "Colonel Getafe" specifically
-    if "Colonel Getafe" in soup.get_text():
-        if "Colonel Getafe" not in teams:
-            teams.append("Colonel Getafe")
+    if "Colonel Getafe" not in teams and "Colonel Getafe" in _TEXT(root):
+        teams.add("Colonel Getafe")
     
     # Look in tables more carefully
-    tables = soup.find_all("table")
-    for table in tables:
-        rows = table.find_all("tr")
-        for row in rows[1:]:  # Skip header
-            cells = row.find_all(["td", "th"])
-            for cell in cells:
-                text = cell.get_text(strip=True)
-                if text and 3 <= len(text) <= 50:
-                    if text not in teams:
-                        teams.append(text)
+    teams.update(table_cells)
     
-    return sorted(list(set(teams)))
+    return sorted(teams)
 
 
-def extract_fixtures(soup: BeautifulSoup, teams: List[str]) -> List[Dict]:
+def extract_fixtures(root: etree._Element, teams: List[str]) -> List[Dict]:
     """Extract match fixtures organized by gameweek."""
     gameweeks = []
     
     # Look for score patterns
-    text = soup.get_text()
-    score_pattern = re.compile(r"(\d+)\s*[-–]\s*(\d+)")
+    text = _TEXT(root)
     
     # Find all score matches
-    matches = list(score_pattern.finditer(text))
+    matches = list(_SCORE_RE.finditer(text))
     
     if matches:
         # Group matches into potential fixtures
@@ -183,17 +281,17 @@ def extract_fixtures(soup: BeautifulSoup, teams: List[str]) -> List[Dict]:
     return gameweeks
 
 
-def scrape_league() -> Dict:
+def scrape_league(max_age_seconds: int = 0) -> Dict:
     """Main scraping function using Selenium."""
     print(f"Fetching data from {LEAGUE_URL} using Selenium...")
-    soup = fetch_page_selenium(LEAGUE_URL)
+    root = fetch_page_selenium(LEAGUE_URL, max_age_seconds)
     
     print("Extracting teams...")
-    teams = extract_teams(soup)
+    teams = extract_teams(root)
     print(f"Found {len(teams)} teams: {', '.join(teams)}")
     
     print("Extracting fixtures...")
-    gameweeks = extract_fixtures(soup, teams)
+    gameweeks = extract_fixtures(root, teams)
     print(f"Found {len(gameweeks)} gameweeks with {sum(len(gw['fixtures']) for gw in gameweeks)} total fixtures")
     
     result = {
@@ -211,16 +309,23 @@ def save_data(data: Dict) -> None:
     """Save scraped data to JSON file."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    DATA_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     
     print(f"Data saved to {DATA_FILE}")
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Scrape league results from playfootball.net using Selenium")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"reuse a cached copy of the rendered page up to {CACHE_MAX_AGE_SECONDS // 3600}h old (for development)",
+    )
+    args = parser.parse_args()
+    
     try:
-        data = scrape_league()
+        data = scrape_league(CACHE_MAX_AGE_SECONDS if args.cache else 0)
         save_data(data)
         print("Scraping completed successfully!")
     except Exception as e: